@@ -16,7 +16,9 @@
 
 """Helper function to validate and parse the json config file"""
 
+from collections import namedtuple
 import json
+import pathlib
 from rockit.common import daemons, IP, validation
 
 CONFIG_SCHEMA = {
@@ -51,7 +53,7 @@ CONFIG_SCHEMA = {
             'type': 'string',
         },
         'serial_baud': {
-            'type': 'number',
+            'type': 'integer',
             'min': 0
         },
         'serial_timeout': {
@@ -134,19 +136,28 @@ CONFIG_SCHEMA = {
     }
 }
 
+SCHEMA_VALIDATORS = {
+    'daemon_name': validation.daemon_name_validator,
+    'machine_name': validation.machine_name_validator
+}
+
+ParkPosition = namedtuple('ParkPosition', ['desc', 'alt', 'az'])
+
 
 class Config:
     """Daemon configuration parsed from a json file"""
+    __slots__ = (
+        'daemon', 'log_name', 'control_ips', 'dome_daemon', 'serial_port', 'serial_baud', 'serial_timeout',
+        'latitude', 'longitude', 'altitude', 'initialize_timeout', 'slew_timeout', 'slew_loop_delay',
+        'idle_loop_delay', 'ha_soft_limits', 'dec_soft_limits', 'park_positions'
+    )
+
     def __init__(self, config_filename):
         # Will throw on file not found or invalid json
-        with open(config_filename, 'r') as config_file:
-            config_json = json.load(config_file)
+        config_json = json.loads(pathlib.Path(config_filename).read_bytes())
 
         # Will throw on schema violations
-        validation.validate_config(config_json, CONFIG_SCHEMA, {
-            'daemon_name': validation.daemon_name_validator,
-            'machine_name': validation.machine_name_validator
-        })
+        validation.validate_config(config_json, CONFIG_SCHEMA, SCHEMA_VALIDATORS)
 
         self.daemon = getattr(daemons, config_json['daemon'])
         self.log_name = config_json['log_name']
@@ -157,15 +168,18 @@ class Config:
             self.dome_daemon = getattr(daemons, config_json['dome_daemon'])
 
         self.serial_port = config_json['serial_port']
-        self.serial_baud = int(config_json['serial_baud'])
-        self.serial_timeout = int(config_json['serial_timeout'])
-        self.latitude = float(config_json['latitude'])
-        self.longitude = float(config_json['longitude'])
-        self.altitude = float(config_json['altitude'])
+        self.serial_baud = config_json['serial_baud']
+        self.serial_timeout = config_json['serial_timeout']
+        self.latitude = config_json['latitude']
+        self.longitude = config_json['longitude']
+        self.altitude = config_json['altitude']
         self.initialize_timeout = config_json['initialize_timeout']
         self.slew_timeout = config_json['slew_timeout']
         self.slew_loop_delay = config_json['slew_loop_delay']
         self.idle_loop_delay = config_json['idle_loop_delay']
-        self.ha_soft_limits = config_json['ha_soft_limits']
-        self.dec_soft_limits = config_json['dec_soft_limits']
-        self.park_positions = config_json['park_positions']
+        self.ha_soft_limits = tuple(config_json['ha_soft_limits'])
+        self.dec_soft_limits = tuple(config_json['dec_soft_limits'])
+        self.park_positions = {
+            name: ParkPosition(park['desc'], park['alt'], park['az'])
+            for name, park in config_json['park_positions'].items()
+        }
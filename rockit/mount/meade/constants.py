@@ -69,21 +69,23 @@ class TelescopeState:
     """Represents the current mount state"""
     Disabled, Initializing, Stopped, Slewing, Tracking = range(5)
 
-    _labels = {
-        0: 'DISABLED',
-        1: 'INITIALIZING',
-        2: 'STOPPED',
-        3: 'SLEWING',
-        4: 'TRACKING',
-    }
-
-    _colors = {
-        0: 'red',
-        1: 'yellow',
-        2: 'red',
-        3: 'yellow',
-        4: 'green'
-    }
+    _labels = (
+        'DISABLED',
+        'INITIALIZING',
+        'STOPPED',
+        'SLEWING',
+        'TRACKING'
+    )
+
+    _colors = (
+        'red',
+        'yellow',
+        'red',
+        'yellow',
+        'green'
+    )
+
+    _formatted_labels = tuple(f'[b][{color}]{label}[/{color}][/b]' for color, label in zip(_colors, _labels))
 
     @classmethod
     def label(cls, status, formatting=False):
@@ -91,11 +93,12 @@ class TelescopeState:
         Returns a human readable string describing a status
         Set formatting=true to enable terminal formatting characters
         """
+        known = 0 <= status < len(cls._labels)
         if formatting:
-            if status in cls._labels and status in cls._colors:
-                return f'[b][{cls._colors[status]}]{cls._labels[status]}[/{cls._colors[status]}][/b]'
+            if known:
+                return cls._formatted_labels[status]
             return '[b][red]UNKNOWN[/red][/b]'
 
-        if status in cls._labels:
+        if known:
             return cls._labels[status]
-        return 'UNKNOWN'
\ No newline at end of file
+        return 'UNKNOWN'